@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 from secrets import compare_digest
 from typing import List, Optional
@@ -8,16 +9,32 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from pydantic import BaseModel, BaseSettings
 
+_HTTP_BASIC = HTTPBasic()
 
-async def basic_auth(credentials: HTTPBasicCredentials = Depends(HTTPBasic())) -> str:
-    correct_username = compare_digest(
-        credentials.username, str(os.getenv("BASIC_AUTH_USERNAME", "test_username"))
-    )
-    correct_password = compare_digest(
-        credentials.password,
-        str(os.getenv("BASIC_AUTH_PASSWORD", "plunge-germane-tribal-pillar")),
-    )
-    if not (correct_username and correct_password):
+
+@lru_cache(maxsize=None)
+def _load_credentials() -> bytes:
+    """Read HTTP Basic Auth credentials from environment variables as bytes."""
+    username = os.getenv("BASIC_AUTH_USERNAME", "test_username")
+    password = os.getenv("BASIC_AUTH_PASSWORD", "plunge-germane-tribal-pillar")
+    return f"{username}\x00{password}".encode("utf-8")
+
+
+def clear_credentials_cache() -> None:
+    """Clear cached credentials so they are re-read from environment variables."""
+    _load_credentials.cache_clear()
+    _verify.cache_clear()
+
+
+@lru_cache(maxsize=1024)
+def _verify(username: str, password: str) -> bool:
+    """Check HTTP Basic Auth credentials, caching results for repeat requests."""
+    credentials = f"{username}\x00{password}".encode("utf-8")
+    return compare_digest(credentials, _load_credentials())
+
+
+async def basic_auth(credentials: HTTPBasicCredentials = Depends(_HTTP_BASIC)) -> str:
+    if not _verify(credentials.username, credentials.password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -1,5 +1,6 @@
-import base64
+import binascii
 import os
+from functools import lru_cache
 from secrets import compare_digest
 from typing import Optional, Tuple
 
@@ -12,27 +13,46 @@ from starlette.authentication import (
 from starlette.requests import HTTPConnection
 
 
+@lru_cache(maxsize=None)
+def _load_credentials() -> bytes:
+    """Read HTTP Basic Auth credentials from environment variables as bytes."""
+    username = os.getenv("BASIC_AUTH_USERNAME", "test_username")
+    password = os.getenv("BASIC_AUTH_PASSWORD", "plunge-germane-tribal-pillar")
+    return f"{username}\x00{password}".encode("utf-8")
+
+
+def clear_credentials_cache() -> None:
+    """Clear cached credentials so they are re-read from environment variables."""
+    _load_credentials.cache_clear()
+    _verify.cache_clear()
+
+
+@lru_cache(maxsize=1024)
+def _verify(username: bytes, password: bytes) -> bool:
+    """Check HTTP Basic Auth credentials, caching results for repeat requests."""
+    return compare_digest(username + b"\x00" + password, _load_credentials())
+
+
 class BasicAuth(AuthenticationBackend):
     async def authenticate(
         self, request: HTTPConnection
     ) -> Optional[Tuple[AuthCredentials, SimpleUser]]:
-        if "Authorization" not in request.headers:
+        auth = request.headers.get("Authorization")
+        if auth is None:
             return None
 
-        auth = request.headers["Authorization"]
-        try:
-            scheme, credentials = auth.split()
-            decoded = base64.b64decode(credentials).decode("ascii")
-            username, _, password = decoded.partition(":")
-            correct_username = compare_digest(
-                username, str(os.getenv("BASIC_AUTH_USERNAME", "test_username"))
-            )
-            correct_password = compare_digest(
-                password,
-                str(os.getenv("BASIC_AUTH_PASSWORD", "plunge-germane-tribal-pillar")),
-            )
-            if not (correct_username and correct_password):
-                raise AuthenticationError("Invalid basic auth credentials")
-            return AuthCredentials(["authenticated"]), SimpleUser(username)
-        except Exception:
-            raise
+        header = auth.encode("latin-1")
+        username = password = b""
+        parsed = False
+        if header[:6].lower() == b"basic ":
+            try:
+                decoded = binascii.a2b_base64(header[6:])
+            except binascii.Error:
+                pass
+            else:
+                username, separator, password = decoded.partition(b":")
+                parsed = bool(separator)
+        verified = _verify(username, password)
+        if not (parsed and verified):
+            raise AuthenticationError("Invalid basic auth credentials")
+        return AuthCredentials(["authenticated"]), SimpleUser(username.decode("utf-8"))
@@ -1,3 +1,4 @@
+import base64
 import os
 import re
 import sys
@@ -37,7 +38,7 @@ class TestCors:
 
     @pytest.mark.parametrize("allowed_origin", origins["allowed"])
     def test_cors_preflight_response_allowed(
-        self, allowed_origin: str, clients: List[TestClient]
+        self, allowed_origin: str, client: TestClient
     ) -> None:
         """Test pre-flight response to cross-origin request from allowed origin."""
         headers: Dict[str, str] = {
@@ -45,16 +46,15 @@ class TestCors:
             "Access-Control-Request-Method": "GET",
             "Access-Control-Request-Headers": "X-Example",
         }
-        for client in clients:
-            response = client.options("/", headers=headers)
-            assert response.status_code == 200, response.text
-            assert response.text == "OK"
-            assert response.headers["access-control-allow-origin"] == allowed_origin
-            assert response.headers["access-control-allow-headers"] == "X-Example"
+        response = client.options("/", headers=headers)
+        assert response.status_code == 200, response.text
+        assert response.text == "OK"
+        assert response.headers["access-control-allow-origin"] == allowed_origin
+        assert response.headers["access-control-allow-headers"] == "X-Example"
 
     @pytest.mark.parametrize("disallowed_origin", origins["disallowed"])
     def test_cors_preflight_response_disallowed(
-        self, disallowed_origin: str, clients: List[TestClient]
+        self, disallowed_origin: str, client: TestClient
     ) -> None:
         """Test pre-flight response to cross-origin request from disallowed origin."""
         headers: Dict[str, str] = {
@@ -62,27 +62,25 @@ class TestCors:
             "Access-Control-Request-Method": "GET",
             "Access-Control-Request-Headers": "X-Example",
         }
-        for client in clients:
-            response = client.options("/", headers=headers)
-            assert response.status_code >= 400
-            assert "Disallowed CORS origin" in response.text
-            assert not response.headers.get("access-control-allow-origin")
+        response = client.options("/", headers=headers)
+        assert response.status_code >= 400
+        assert "Disallowed CORS origin" in response.text
+        assert not response.headers.get("access-control-allow-origin")
 
     @pytest.mark.parametrize("allowed_origin", origins["allowed"])
     def test_cors_response_allowed(
-        self, allowed_origin: str, clients: List[TestClient]
+        self, allowed_origin: str, client: TestClient
     ) -> None:
         """Test response to cross-origin request from allowed origin."""
         headers = {"Origin": allowed_origin}
-        for client in clients:
-            response = client.get("/", headers=headers)
-            assert response.status_code == 200, response.text
-            assert response.json() == {"Hello": "World"}
-            assert response.headers["access-control-allow-origin"] == allowed_origin
+        response = client.get("/", headers=headers)
+        assert response.status_code == 200, response.text
+        assert response.json() == {"Hello": "World"}
+        assert response.headers["access-control-allow-origin"] == allowed_origin
 
     @pytest.mark.parametrize("disallowed_origin", origins["disallowed"])
     def test_cors_response_disallowed(
-        self, disallowed_origin: str, clients: List[TestClient]
+        self, disallowed_origin: str, client: TestClient
     ) -> None:
         """Test response to cross-origin request from disallowed origin.
         As explained in the Starlette test suite in tests/middleware/`test_cors.py`,
@@ -91,18 +89,16 @@ class TestCors:
         "Access-Control-Allow-Origin" header in the response.
         """
         headers = {"Origin": disallowed_origin}
-        for client in clients:
-            response = client.get("/", headers=headers)
-            assert response.status_code == 200
-            assert not response.headers.get("access-control-allow-origin")
+        response = client.get("/", headers=headers)
+        assert response.status_code == 200
+        assert not response.headers.get("access-control-allow-origin")
 
-    def test_non_cors(self, clients: List[TestClient]) -> None:
+    def test_non_cors(self, client: TestClient) -> None:
         """Test non-CORS response."""
-        for client in clients:
-            response = client.get("/")
-            assert response.status_code == 200, response.text
-            assert response.json() == {"Hello": "World"}
-            assert "access-control-allow-origin" not in response.headers
+        response = client.get("/")
+        assert response.status_code == 200, response.text
+        assert response.json() == {"Hello": "World"}
+        assert "access-control-allow-origin" not in response.headers
 
 
 class TestEndpoints:
@@ -155,53 +151,60 @@ class TestEndpoints:
         assert os.getenv("WITH_RELOAD") == "false"
         with pytest.raises(NameError) as e:
             client_asgi.get("/")
-            assert str(e) == "Process manager needs to be either uvicorn or gunicorn."
+        assert str(e.value) == "Process manager needs to be either uvicorn or gunicorn."
 
-    def test_get_root(self, clients: List[TestClient]) -> None:
+    def test_get_root(self, client: TestClient) -> None:
         """Test a `GET` request to the root endpoint."""
-        for client in clients:
-            response = client.get("/")
-            assert response.status_code == 200
-            assert response.json() == {"Hello": "World"}
+        response = client.get("/")
+        assert response.status_code == 200
+        assert response.json() == {"Hello": "World"}
 
     @pytest.mark.parametrize("endpoint", ["/health", "/status"])
     def test_gets_with_basic_auth(
-        self, basic_auth: tuple, clients: List[TestClient], endpoint: str
+        self, basic_auth: tuple, client: TestClient, endpoint: str
     ) -> None:
         """Test `GET` requests to endpoints that require HTTP Basic Auth."""
-        for client in clients:
-            assert client.get(endpoint).status_code in [401, 403]
-            response = client.get(endpoint, auth=basic_auth)
-            assert response.status_code == 200
-            assert "application" in response.json().keys()
-            assert "status" in response.json().keys()
-            assert response.json()["application"] == "inboard"
-            assert response.json()["status"] == "active"
+        assert client.get(endpoint).status_code in [401, 403]
+        response = client.get(endpoint, auth=basic_auth)
+        assert response.status_code == 200
+        response_json = response.json()
+        assert "application" in response_json
+        assert "status" in response_json
+        assert response_json["application"] == "inboard"
+        assert response_json["status"] == "active"
 
     @pytest.mark.parametrize("endpoint", ["/health", "/status"])
     def test_gets_with_basic_auth_incorrect(
-        self, basic_auth: tuple, clients: List[TestClient], endpoint: str
+        self, basic_auth: tuple, client: TestClient, endpoint: str
     ) -> None:
         """Test `GET` requests to Basic Auth endpoints with incorrect credentials."""
         basic_auth_username, basic_auth_password = basic_auth
-        for client in clients:
-            assert client.get(endpoint).status_code in [401, 403]
-            auth_combos = [
-                ("incorrect_username", "incorrect_password"),
-                ("incorrect_username", basic_auth_password),
-                (basic_auth_username, "incorrect_password"),
-            ]
-            responses = [client.get(endpoint, auth=combo) for combo in auth_combos]
-            assert [response.status_code in [401, 403] for response in responses]
-            response = client.get(endpoint, auth=basic_auth)
-            assert response.status_code == 200
+        assert client.get(endpoint).status_code in [401, 403]
+        auth_combos = [
+            ("incorrect_username", "incorrect_password"),
+            ("incorrect_username", basic_auth_password),
+            (basic_auth_username, "incorrect_password"),
+        ]
+        responses = [client.get(endpoint, auth=combo) for combo in auth_combos]
+        assert all(response.status_code in [401, 403] for response in responses)
+        response = client.get(endpoint, auth=basic_auth)
+        assert response.status_code == 200
+
+    @pytest.mark.parametrize("basic_auth", [("a:b", "c")], ids=["colon"], indirect=True)
+    def test_gets_with_basic_auth_colon_in_username(
+        self, basic_auth: tuple, client: TestClient, endpoint: str = "/status"
+    ) -> None:
+        """Test Basic Auth when the configured username contains a colon.
+        The header value `a:b:c` splits into username `a` and password `b:c`, so it
+        must not match username `a:b` and password `c`.
+        """
+        assert client.get(endpoint, auth=basic_auth).status_code in [401, 403]
 
     @pytest.mark.parametrize("endpoint", ["/health", "/status"])
     def test_gets_with_starlette_auth_exception(
-        self, clients: List[TestClient], endpoint: str
+        self, starlette_client: TestClient, endpoint: str
     ) -> None:
         """Test Starlette `GET` requests with incorrect Basic Auth credentials."""
-        starlette_client = clients[1]
         assert isinstance(starlette_client.app, Starlette)
         response = starlette_client.get(endpoint, auth=("user", "pass"))
         assert response.status_code in [401, 403]
@@ -210,39 +213,104 @@ class TestEndpoints:
             "error": "Invalid basic auth credentials",
         }
 
+    @pytest.mark.parametrize(
+        "authorization", ["Basic", "Basic not-base64", "Basic dXNlcm5hbWU="]
+    )
+    def test_gets_with_starlette_auth_malformed(
+        self,
+        authorization: str,
+        starlette_client: TestClient,
+        endpoint: str = "/status",
+    ) -> None:
+        """Test Starlette `GET` requests with malformed Basic Auth headers."""
+        assert isinstance(starlette_client.app, Starlette)
+        response = starlette_client.get(
+            endpoint, headers={"Authorization": authorization}
+        )
+        assert response.status_code == 401
+        assert response.json() == {
+            "detail": "Incorrect username or password",
+            "error": "Invalid basic auth credentials",
+        }
+
+    @pytest.mark.parametrize("basic_auth", [("", "")], ids=["empty"], indirect=True)
+    @pytest.mark.parametrize(
+        "authorization", ["garbage", "Basic", "Basic !!!", "Basic dXNlcm5hbWU="]
+    )
+    def test_gets_with_starlette_auth_malformed_empty_credentials(
+        self,
+        authorization: str,
+        basic_auth: tuple,
+        starlette_client: TestClient,
+        endpoint: str = "/status",
+    ) -> None:
+        """Test Starlette `GET` requests with malformed headers and empty credentials.
+        Headers that cannot be parsed must not match an empty username and password.
+        """
+        response = starlette_client.get(
+            endpoint, headers={"Authorization": authorization}
+        )
+        assert response.status_code == 401
+        response = starlette_client.get(endpoint, auth=basic_auth)
+        assert response.status_code == 200
+
+    @pytest.mark.parametrize(
+        "basic_auth",
+        [("test_username", "plunge-germane-tribal-pillar"), ("", "")],
+        ids=["default", "empty"],
+        indirect=True,
+    )
+    @pytest.mark.parametrize("scheme", ["Bearer", "Digest", "Basicx"])
+    def test_gets_with_starlette_auth_scheme_incorrect(
+        self,
+        basic_auth: tuple,
+        starlette_client: TestClient,
+        scheme: str,
+        endpoint: str = "/status",
+    ) -> None:
+        """Test Starlette `GET` requests with correct credentials but another scheme."""
+        credentials = base64.b64encode(":".join(basic_auth).encode()).decode()
+        response = starlette_client.get(
+            endpoint, headers={"Authorization": f"{scheme} {credentials}"}
+        )
+        assert response.status_code == 401
+        response = starlette_client.get(
+            endpoint, headers={"Authorization": f"basic {credentials}"}
+        )
+        assert response.status_code == 200
+
     def test_get_status_message(
         self,
         basic_auth: tuple,
-        clients: List[TestClient],
+        client: TestClient,
         endpoint: str = "/status",
     ) -> None:
         """Test the message returned by a `GET` request to a status endpoint."""
-        for client in clients:
-            assert client.get(endpoint).status_code in [401, 403]
-            response = client.get(endpoint, auth=basic_auth)
-            assert response.status_code == 200
-            assert "message" in response.json().keys()
-            assert "Hello World, from Uvicorn" in response.json()["message"]
-            assert [
-                word in re.split(r"[!?',;.\s]+", response.json()["message"])
-                for word in ["Hello", "World", "Uvicorn", "Python"]
-            ]
-            if isinstance(client.app, FastAPI):
-                assert "FastAPI" in response.json()["message"]
-            elif isinstance(client.app, Starlette):
-                assert "Starlette" in response.json()["message"]
+        assert client.get(endpoint).status_code in [401, 403]
+        response = client.get(endpoint, auth=basic_auth)
+        assert response.status_code == 200
+        response_json = response.json()
+        assert "message" in response_json
+        message = response_json["message"]
+        assert "Hello World, from Uvicorn" in message
+        words = set(re.split(r"[!?',;.\s]+", message))
+        assert all(word in words for word in ["Hello", "World", "Uvicorn", "Python"])
+        if isinstance(client.app, FastAPI):
+            assert "FastAPI" in message
+        elif isinstance(client.app, Starlette):
+            assert "Starlette" in message
 
     def test_get_user(
         self,
         basic_auth: tuple,
-        clients: List[TestClient],
+        client: TestClient,
         endpoint: str = "/users/me",
     ) -> None:
         """Test a `GET` request to an endpoint providing user information."""
-        for client in clients:
-            assert client.get(endpoint).status_code in [401, 403]
-            response = client.get(endpoint, auth=basic_auth)
-            assert response.status_code == 200
-            assert "application" not in response.json().keys()
-            assert "status" not in response.json().keys()
-            assert response.json()["username"] == "test_username"
+        assert client.get(endpoint).status_code in [401, 403]
+        response = client.get(endpoint, auth=basic_auth)
+        assert response.status_code == 200
+        response_json = response.json()
+        assert "application" not in response_json
+        assert "status" not in response_json
+        assert response_json["username"] == "test_username"
@@ -1,8 +1,9 @@
+import copy
 import logging
 import os
 import shutil
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterator, Optional, Union
 
 import pytest
 from fastapi.testclient import TestClient
@@ -11,32 +12,57 @@ from pytest_mock import MockerFixture
 from inboard import gunicorn_conf as gunicorn_conf_module
 from inboard import logging_conf as logging_conf_module
 from inboard.app import prestart as pre_start_module
+from inboard.app import utilities_fastapi, utilities_starlette
 from inboard.app.main_base import app as base_app
 from inboard.app.main_fastapi import app as fastapi_app
 from inboard.app.main_starlette import app as starlette_app
 from inboard.app.utilities_fastapi import Settings
 
+_GUNICORN_CONF_PATH = Path(gunicorn_conf_module.__file__)
+_LOGGING_CONF_PATH = Path(logging_conf_module.__file__)
+_PRE_START_PATH = Path(pre_start_module.__file__)
+
+
+def _link_or_copy(src: Union[Path, str], dst: Union[Path, str]) -> Union[Path, str]:
+    """Hard-link a file into place, copying if links are unsupported."""
+    if not os.path.exists(dst):
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copy(src, dst)
+    return dst
+
 
 @pytest.fixture(scope="session")
 def app_module_tmp_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Copy app modules to temporary directory to test custom app module paths."""
     tmp_dir = tmp_path_factory.mktemp("app")
-    shutil.copytree(Path(pre_start_module.__file__).parent, Path(f"{tmp_dir}/tmp_app"))
+    shutil.copytree(
+        _PRE_START_PATH.parent, tmp_dir / "tmp_app", copy_function=_link_or_copy
+    )
     return tmp_dir
 
 
 @pytest.fixture
 def basic_auth(
     monkeypatch: pytest.MonkeyPatch,
+    request: pytest.FixtureRequest,
     username: str = "test_username",
     password: str = "plunge-germane-tribal-pillar",
-) -> tuple:
-    """Set username and password for HTTP Basic Auth."""
+) -> Iterator[tuple]:
+    """Set username and password for HTTP Basic Auth.
+    Other credentials can be supplied with indirect parametrization. The cached
+    credentials are cleared on setup and teardown, so they follow the environment
+    variables set for each test.
+    """
+    username, password = getattr(request, "param", (username, password))
     monkeypatch.setenv("BASIC_AUTH_USERNAME", username)
     monkeypatch.setenv("BASIC_AUTH_PASSWORD", password)
-    assert os.getenv("BASIC_AUTH_USERNAME") == username
-    assert os.getenv("BASIC_AUTH_PASSWORD") == password
-    return username, password
+    utilities_fastapi.clear_credentials_cache()
+    utilities_starlette.clear_credentials_cache()
+    yield username, password
+    utilities_fastapi.clear_credentials_cache()
+    utilities_starlette.clear_credentials_cache()
 
 
 @pytest.fixture(scope="session")
@@ -45,19 +71,29 @@ def client_asgi() -> TestClient:
     return TestClient(base_app)
 
 
+@pytest.fixture(
+    scope="session",
+    params=["fastapi_client", "starlette_client"],
+    ids=["fastapi", "starlette"],
+)
+def client(request: pytest.FixtureRequest) -> TestClient:
+    """Provide the test client for each app."""
+    return request.getfixturevalue(request.param)
+
+
 @pytest.fixture(scope="session")
-def clients() -> List[TestClient]:
-    """Instantiate test client classes."""
-    return [TestClient(fastapi_app), TestClient(starlette_app)]
+def fastapi_client() -> Iterator[TestClient]:
+    """Instantiate a test client for the FastAPI app, running its lifespan once."""
+    test_client = TestClient(fastapi_app)
+    with test_client:
+        yield test_client
 
 
 @pytest.fixture
 def gunicorn_conf_path(monkeypatch: pytest.MonkeyPatch) -> Path:
     """Set path to default Gunicorn configuration file."""
-    path = Path(gunicorn_conf_module.__file__)
-    monkeypatch.setenv("GUNICORN_CONF", str(path))
-    assert os.getenv("GUNICORN_CONF") == str(path)
-    return path
+    monkeypatch.setenv("GUNICORN_CONF", str(_GUNICORN_CONF_PATH))
+    return _GUNICORN_CONF_PATH
 
 
 @pytest.fixture(scope="session")
@@ -66,33 +102,29 @@ def gunicorn_conf_tmp_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
     return tmp_path_factory.mktemp("gunicorn")
 
 
-@pytest.fixture
-def gunicorn_conf_tmp_file_path(
-    gunicorn_conf_tmp_path: Path,
-    monkeypatch: pytest.MonkeyPatch,
-    tmp_path_factory: pytest.TempPathFactory,
-) -> Path:
-    """Copy gunicorn configuration file to temporary directory."""
-    tmp_file = Path(f"{gunicorn_conf_tmp_path}/gunicorn_conf.py")
-    shutil.copy(Path(gunicorn_conf_module.__file__), tmp_file)
-    monkeypatch.setenv("GUNICORN_CONF", str(tmp_file))
-    assert os.getenv("GUNICORN_CONF", str(tmp_file))
+@pytest.fixture(scope="session")
+def gunicorn_conf_tmp_file_path(gunicorn_conf_tmp_path: Path) -> Path:
+    """Copy gunicorn configuration file to temporary directory.
+    The file is shared across the session. Tests set `GUNICORN_CONF` themselves.
+    """
+    tmp_file = gunicorn_conf_tmp_path / "gunicorn_conf.py"
+    _link_or_copy(_GUNICORN_CONF_PATH, tmp_file)
     return tmp_file
 
 
-@pytest.fixture
-def logging_conf_dict(mocker: MockerFixture) -> Dict[str, Any]:
-    """Load logging configuration dictionary from logging configuration module."""
-    return mocker.patch.dict(logging_conf_module.LOGGING_CONFIG)
+@pytest.fixture(scope="session")
+def logging_conf_dict() -> Dict[str, Any]:
+    """Load logging configuration dictionary from logging configuration module.
+    The copy is shared across the session, so tests must not modify it.
+    """
+    return copy.deepcopy(logging_conf_module.LOGGING_CONFIG)
 
 
 @pytest.fixture
 def logging_conf_file_path(monkeypatch: pytest.MonkeyPatch) -> Path:
     """Set path to default logging configuration file."""
-    path = Path(logging_conf_module.__file__)
-    monkeypatch.setenv("LOGGING_CONF", str(path))
-    assert os.getenv("LOGGING_CONF") == str(path)
-    return path
+    monkeypatch.setenv("LOGGING_CONF", str(_LOGGING_CONF_PATH))
+    return _LOGGING_CONF_PATH
 
 
 @pytest.fixture
@@ -100,7 +132,6 @@ def logging_conf_module_path(monkeypatch: pytest.MonkeyPatch) -> str:
     """Set module path to logging_conf.py."""
     path = "inboard.logging_conf"
     monkeypatch.setenv("LOGGING_CONF", path)
-    assert os.getenv("LOGGING_CONF") == path
     return path
 
 
@@ -108,7 +139,7 @@ def logging_conf_module_path(monkeypatch: pytest.MonkeyPatch) -> str:
 def logging_conf_tmp_file_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Copy logging configuration module to custom temporary location."""
     tmp_dir = tmp_path_factory.mktemp("tmp_log")
-    shutil.copy(Path(logging_conf_module.__file__), Path(f"{tmp_dir}/tmp_log.py"))
+    _link_or_copy(_LOGGING_CONF_PATH, tmp_dir / "tmp_log.py")
     return tmp_dir
 
 
@@ -117,16 +148,17 @@ def logging_conf_tmp_path_no_dict(tmp_path_factory: pytest.TempPathFactory) -> P
     """Create temporary logging config file without logging config dict."""
     tmp_dir = tmp_path_factory.mktemp("tmp_log_no_dict")
     tmp_file = tmp_dir / "no_dict.py"
-    with open(Path(tmp_file), "x") as f:
-        f.write("print('Hello, World!')\n")
+    tmp_file.write_text("print('Hello, World!')\n")
     return tmp_dir
 
 
-@pytest.fixture
-def logging_conf_tmp_path_incorrect_extension(tmp_path: Path) -> Path:
+@pytest.fixture(scope="session")
+def logging_conf_tmp_path_incorrect_extension(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Path:
     """Create custom temporary logging config file with incorrect extension."""
-    tmp_file = tmp_path / "tmp_logging_conf.txt"
-    return Path(tmp_file)
+    tmp_dir = tmp_path_factory.mktemp("tmp_log_incorrect_extension")
+    return tmp_dir / "tmp_logging_conf.txt"
 
 
 @pytest.fixture(scope="session")
@@ -136,41 +168,77 @@ def logging_conf_tmp_path_incorrect_type(
     """Create temporary logging config file with incorrect LOGGING_CONFIG type."""
     tmp_dir = tmp_path_factory.mktemp("tmp_log_incorrect_type")
     tmp_file = tmp_dir / "incorrect_type.py"
-    with open(Path(tmp_file), "x") as f:
-        f.write("LOGGING_CONFIG: list = ['Hello', 'World']\n")
+    tmp_file.write_text("LOGGING_CONFIG: list = ['Hello', 'World']\n")
     return tmp_dir
 
 
+@pytest.fixture(scope="module")
+def _mock_logger_module(module_mocker: MockerFixture) -> logging.Logger:
+    """Patch the methods of a dedicated test logger once per module with pytest-mock.
+    The root logger is left alone, so tests that do not request a mock are unaffected.
+    """
+    logger = logging.getLogger("inboard.tests")
+    module_mocker.patch.object(logger, "debug")
+    module_mocker.patch.object(logger, "error")
+    module_mocker.patch.object(logger, "info")
+    return logger
+
+
 @pytest.fixture
-def mock_logger(mocker: MockerFixture) -> logging.Logger:
+def mock_logger(_mock_logger_module: logging.Logger) -> logging.Logger:
     """Mock the logger with pytest-mock and a pytest fixture.
     - https://github.com/pytest-dev/pytest-mock
     - https://docs.pytest.org/en/latest/fixture.html
+    The module-scoped mocks are reset before each test that requests them.
     """
-    logger = logging.getLogger()
-    mocker.patch.object(logger, "debug")
-    mocker.patch.object(logger, "error")
-    mocker.patch.object(logger, "info")
-    return logger
+    for method in ("debug", "error", "info"):
+        getattr(_mock_logger_module, method).reset_mock()
+    return _mock_logger_module
 
 
-@pytest.fixture
-def pre_start_script_tmp_py(tmp_path: Path) -> Path:
+@pytest.fixture(scope="session")
+def pre_start_script_tmp_py(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Copy pre-start script to custom temporary file."""
-    tmp_file = shutil.copy(Path(pre_start_module.__file__), tmp_path)
-    return Path(tmp_file)
+    tmp_file = tmp_path_factory.mktemp("prestart_py") / _PRE_START_PATH.name
+    _link_or_copy(_PRE_START_PATH, tmp_file)
+    return tmp_file
 
 
-@pytest.fixture
-def pre_start_script_tmp_sh(tmp_path: Path) -> Path:
+@pytest.fixture(scope="session")
+def pre_start_script_tmp_sh(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Create custom temporary pre-start shell script."""
-    tmp_file = tmp_path / "prestart.sh"
-    with open(Path(tmp_file), "x") as f:
-        f.write('echo "Hello World, from a temporary pre-start shell script"\n')
-    return Path(tmp_file)
+    tmp_file = tmp_path_factory.mktemp("prestart_sh") / "prestart.sh"
+    tmp_file.write_text('echo "Hello World, from a temporary pre-start shell script"\n')
+    return tmp_file
+
+
+@pytest.fixture
+def setenvs(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Callable[[Dict[str, Optional[str]]], None]:
+    """Set a batch of environment variables for the duration of a test.
+    Variables with a value of `None` are removed if present.
+    """
+
+    def _setenvs(env: Dict[str, Optional[str]]) -> None:
+        for name, value in env.items():
+            if value is None:
+                monkeypatch.delenv(name, raising=False)
+            else:
+                monkeypatch.setenv(name, value)
+
+    return _setenvs
 
 
 @pytest.fixture(scope="session")
 def settings() -> Settings:
     """Instantiate a _pydantic_ Settings model for testing."""
     return Settings()
+
+
+@pytest.fixture(scope="session")
+def starlette_client() -> Iterator[TestClient]:
+    """Instantiate a test client for the Starlette app, running its lifespan once."""
+    test_client = TestClient(starlette_app)
+    with test_client:
+        yield test_client
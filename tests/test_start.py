@@ -2,13 +2,21 @@ import logging
 import multiprocessing
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
+from unittest.mock import patch
 
 import pytest
 from pytest_mock import MockerFixture
 
 from inboard import gunicorn_conf, start
 
+_CPU_COUNT = multiprocessing.cpu_count()
+_GUNICORN_ARGV_PREFIX = ["gunicorn", "-k", "uvicorn.workers.UvicornWorker", "-c"]
+_LOGGER_ERR_APP = "Error when setting app module:"
+_LOGGER_ERR_LOG = "Error when setting logging module:"
+_LOGGER_ERR_START = "Error when starting server with start script:"
+_SetEnvs = Callable[[Dict[str, Optional[str]]], None]
+
 
 class TestConfPaths:
     """Test paths to configuration files.
@@ -17,9 +25,10 @@ class TestConfPaths:
 
     def test_set_default_conf_path_gunicorn(self, gunicorn_conf_path: Path) -> None:
         """Test default Gunicorn configuration file path (different without Docker)."""
-        assert "inboard/gunicorn_conf.py" in str(gunicorn_conf_path)
-        assert "logging" not in str(gunicorn_conf_path)
-        assert start.set_conf_path("gunicorn") == str(gunicorn_conf_path)
+        conf_path = os.fspath(gunicorn_conf_path)
+        assert "inboard/gunicorn_conf.py" in conf_path
+        assert "logging" not in conf_path
+        assert start.set_conf_path("gunicorn") == conf_path
 
     def test_set_custom_conf_path_gunicorn(
         self,
@@ -28,11 +37,12 @@ class TestConfPaths:
         tmp_path: Path,
     ) -> None:
         """Set path to custom temporary Gunicorn configuration file."""
-        monkeypatch.setenv("GUNICORN_CONF", str(gunicorn_conf_tmp_file_path))
-        assert os.getenv("GUNICORN_CONF") == str(gunicorn_conf_tmp_file_path)
-        assert "/gunicorn_conf.py" in str(gunicorn_conf_tmp_file_path)
-        assert "logging" not in str(gunicorn_conf_tmp_file_path)
-        assert start.set_conf_path("gunicorn") == str(gunicorn_conf_tmp_file_path)
+        conf_path = os.fspath(gunicorn_conf_tmp_file_path)
+        monkeypatch.setenv("GUNICORN_CONF", conf_path)
+        assert os.getenv("GUNICORN_CONF") == conf_path
+        assert "/gunicorn_conf.py" in conf_path
+        assert "logging" not in conf_path
+        assert start.set_conf_path("gunicorn") == conf_path
 
     def test_set_incorrect_conf_path(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Set path to non-existent file and raise an error."""
@@ -49,18 +59,13 @@ class TestConfigureGunicorn:
     def test_gunicorn_conf_workers_default(self) -> None:
         """Test default number of Gunicorn worker processes."""
         assert gunicorn_conf.workers >= 2
-        assert gunicorn_conf.workers == multiprocessing.cpu_count()
+        assert gunicorn_conf.workers == _CPU_COUNT
 
     def test_gunicorn_conf_workers_custom_max(
-        self, monkeypatch: pytest.MonkeyPatch
+        self, setenvs: _SetEnvs
     ) -> None:
         """Test custom Gunicorn worker process calculation."""
-        monkeypatch.setenv("MAX_WORKERS", "1")
-        monkeypatch.setenv("WEB_CONCURRENCY", "4")
-        monkeypatch.setenv("WORKERS_PER_CORE", "0.5")
-        assert os.getenv("MAX_WORKERS") == "1"
-        assert os.getenv("WEB_CONCURRENCY") == "4"
-        assert os.getenv("WORKERS_PER_CORE") == "0.5"
+        setenvs({"MAX_WORKERS": "1", "WEB_CONCURRENCY": "4", "WORKERS_PER_CORE": "0.5"})
         assert (
             gunicorn_conf.calculate_workers(
                 str(os.getenv("MAX_WORKERS")),
@@ -72,13 +77,10 @@ class TestConfigureGunicorn:
 
     @pytest.mark.parametrize("number_of_workers", ["1", "2", "4"])
     def test_gunicorn_conf_workers_custom_concurrency(
-        self, monkeypatch: pytest.MonkeyPatch, number_of_workers: str
+        self, number_of_workers: str, setenvs: _SetEnvs
     ) -> None:
         """Test custom Gunicorn worker process calculation."""
-        monkeypatch.setenv("WEB_CONCURRENCY", number_of_workers)
-        monkeypatch.setenv("WORKERS_PER_CORE", "0.5")
-        assert os.getenv("WEB_CONCURRENCY") == number_of_workers
-        assert os.getenv("WORKERS_PER_CORE") == "0.5"
+        setenvs({"WEB_CONCURRENCY": number_of_workers, "WORKERS_PER_CORE": "0.5"})
         assert (
             gunicorn_conf.calculate_workers(
                 None,
@@ -90,35 +92,27 @@ class TestConfigureGunicorn:
 
     @pytest.mark.parametrize("concurrency", [None, "10"])
     def test_gunicorn_conf_workers_custom_cores(
-        self, monkeypatch: pytest.MonkeyPatch, concurrency: Optional[str]
+        self, concurrency: Optional[str], setenvs: _SetEnvs
     ) -> None:
         """Test custom Gunicorn worker process calculation.
         - Assert that number of workers equals `WORKERS_PER_CORE`, and is at least 2.
         - Assert that setting `WEB_CONCURRENCY` overrides `WORKERS_PER_CORE`.
         """
-        monkeypatch.setenv("WORKERS_PER_CORE", "0.5")
-        workers_per_core = os.getenv("WORKERS_PER_CORE")
-        assert workers_per_core == "0.5"
-        cores: int = multiprocessing.cpu_count()
+        setenvs({"WORKERS_PER_CORE": "0.5"})
+        workers_per_core = str(os.getenv("WORKERS_PER_CORE"))
         assert gunicorn_conf.calculate_workers(
-            None, None, workers_per_core, cores=cores
-        ) == max(int(cores * float(workers_per_core)), 2)
+            None, None, workers_per_core, cores=_CPU_COUNT
+        ) == max(int(_CPU_COUNT * float(workers_per_core)), 2)
         assert (
-            gunicorn_conf.calculate_workers(None, "10", workers_per_core, cores=cores)
-            == 10
-        )
-        monkeypatch.setenv("WEB_CONCURRENCY", concurrency) if concurrency else None
-        assert os.getenv("WEB_CONCURRENCY") == concurrency
-        assert (
-            (
-                gunicorn_conf.calculate_workers(
-                    None, concurrency, workers_per_core, cores=cores
-                )
-                == 10
+            gunicorn_conf.calculate_workers(
+                None, "10", workers_per_core, cores=_CPU_COUNT
             )
-            if concurrency
-            else max(int(cores * float(workers_per_core)), 2)
+            == 10
         )
+        setenvs({"WEB_CONCURRENCY": concurrency} if concurrency else {})
+        assert gunicorn_conf.calculate_workers(
+            None, concurrency, workers_per_core, cores=_CPU_COUNT
+        ) == (10 if concurrency else max(int(_CPU_COUNT * float(workers_per_core)), 2))
 
 
 class TestConfigureLogging:
@@ -131,7 +125,7 @@ class TestConfigureLogging:
     ) -> None:
         """Test `start.configure_logging` with correct logging config file path."""
         start.configure_logging(
-            logger=mock_logger, logging_conf=str(logging_conf_file_path)
+            logger=mock_logger, logging_conf=os.fspath(logging_conf_file_path)
         )
         mock_logger.debug.assert_called_once_with(  # type: ignore[attr-defined]
             f"Logging dict config loaded from {logging_conf_file_path}."
@@ -152,13 +146,11 @@ class TestConfigureLogging:
         self, mock_logger: logging.Logger
     ) -> None:
         """Test `start.configure_logging` with incorrect logging config module path."""
-        with pytest.raises(ImportError):
+        with pytest.raises(ImportError) as e:
             start.configure_logging(logger=mock_logger, logging_conf="no.module.here")
-            import_error_msg = "Unable to import no.module.here."
-            logger_error_msg = "Error when configuring logging:"
-            mock_logger.debug.assert_called_once_with(  # type: ignore[attr-defined]
-                f"{logger_error_msg} {import_error_msg}."
-            )
+        mock_logger.debug.assert_called_once_with(  # type: ignore[attr-defined]
+            f"{_LOGGER_ERR_LOG} {e.value}."
+        )
 
     def test_configure_logging_tmp_file(
         self, logging_conf_tmp_file_path: Path, mock_logger: logging.Logger
@@ -177,18 +169,14 @@ class TestConfigureLogging:
         mock_logger: logging.Logger,
     ) -> None:
         """Test `start.configure_logging` with incorrect temporary file type."""
-        with pytest.raises(ImportError):
+        with pytest.raises(ImportError) as e:
             start.configure_logging(
                 logger=mock_logger,
-                logging_conf=str(logging_conf_tmp_path_incorrect_extension),
-            )
-            import_error_msg = (
-                f"Unable to import {logging_conf_tmp_path_incorrect_extension}."
-            )
-            logger_error_msg = "Error when configuring logging:"
-            mock_logger.debug.assert_called_once_with(  # type: ignore[attr-defined]
-                f"{logger_error_msg} {import_error_msg}."
+                logging_conf=os.fspath(logging_conf_tmp_path_incorrect_extension),
             )
+        mock_logger.debug.assert_called_once_with(  # type: ignore[attr-defined]
+            f"{_LOGGER_ERR_LOG} {e.value}."
+        )
 
     def test_configure_logging_tmp_module(
         self,
@@ -220,11 +208,10 @@ class TestConfigureLogging:
         assert os.getenv("LOGGING_CONF") == "incorrect_type"
         with pytest.raises(TypeError):
             start.configure_logging(logger=mock_logger, logging_conf="incorrect_type")
-            logger_error_msg = "Error when configuring logging:"
-            type_error_msg = "LOGGING_CONFIG is not a dictionary instance."
-            mock_logger.debug.assert_called_once_with(  # type: ignore[attr-defined]
-                f"{logger_error_msg} {type_error_msg}."
-            )
+        type_error_msg = "LOGGING_CONFIG is not a dictionary instance."
+        mock_logger.debug.assert_called_once_with(  # type: ignore[attr-defined]
+            f"{_LOGGER_ERR_LOG} {type_error_msg}."
+        )
 
     def test_configure_logging_tmp_module_no_dict(
         self,
@@ -239,13 +226,12 @@ class TestConfigureLogging:
         monkeypatch.syspath_prepend(logging_conf_tmp_path_no_dict)
         monkeypatch.setenv("LOGGING_CONF", "no_dict")
         assert os.getenv("LOGGING_CONF") == "no_dict"
-        with pytest.raises(AttributeError):
+        with pytest.raises(AttributeError) as e:
             start.configure_logging(logger=mock_logger, logging_conf="no_dict")
-            logger_error_msg = "Error when configuring logging:"
-            attribute_error_msg = "No LOGGING_CONFIG in no_dict."
-            mock_logger.debug.assert_called_once_with(  # type: ignore[attr-defined]
-                f"{logger_error_msg} {attribute_error_msg}."
-            )
+        assert str(e.value).startswith("No LOGGING_CONFIG in")
+        mock_logger.debug.assert_called_once_with(  # type: ignore[attr-defined]
+            f"{_LOGGER_ERR_LOG} {e.value}."
+        )
 
 
 class TestSetAppModule:
@@ -253,94 +239,51 @@ class TestSetAppModule:
     ---
     """
 
-    def test_set_app_module_asgi(
-        self, mock_logger: logging.Logger, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """Test `start.set_app_module` using module path to base ASGI app."""
-        monkeypatch.setenv("APP_MODULE", "inboard.app.main_base:app")
-        start.set_app_module(logger=mock_logger)
-        mock_logger.debug.assert_called_once_with(  # type: ignore[attr-defined]
-            "App module set to inboard.app.main_base:app."
-        )
-
-    def test_set_app_module_fastapi(
-        self, mock_logger: logging.Logger, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """Test `start.set_app_module` using module path to FastAPI app."""
-        monkeypatch.setenv("APP_MODULE", "inboard.app.main_fastapi:app")
-        start.set_app_module(logger=mock_logger)
-        mock_logger.debug.assert_called_once_with(  # type: ignore[attr-defined]
-            "App module set to inboard.app.main_fastapi:app."
-        )
-
-    def test_set_app_module_starlette(
-        self, mock_logger: logging.Logger, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """Test `start.set_app_module` using module path to Starlette app."""
-        monkeypatch.setenv("APP_MODULE", "inboard.app.main_starlette:app")
-        start.set_app_module(logger=mock_logger)
-        mock_logger.debug.assert_called_once_with(  # type: ignore[attr-defined]
-            "App module set to inboard.app.main_starlette:app."
-        )
-
-    def test_set_app_module_custom_asgi(
-        self,
-        app_module_tmp_path: Path,
-        mock_logger: logging.Logger,
-        monkeypatch: pytest.MonkeyPatch,
-    ) -> None:
-        """Test `start.set_app_module` with custom module path to base ASGI app."""
-        monkeypatch.syspath_prepend(app_module_tmp_path)
-        monkeypatch.setenv("APP_MODULE", "tmp_app.main_base:app")
-        start.set_app_module(logger=mock_logger)
-        mock_logger.debug.assert_called_once_with(  # type: ignore[attr-defined]
-            "App module set to tmp_app.main_base:app."
-        )
-
-    def test_set_app_module_custom_fastapi(
-        self,
-        app_module_tmp_path: Path,
-        mock_logger: logging.Logger,
-        monkeypatch: pytest.MonkeyPatch,
-    ) -> None:
-        """Test `start.set_app_module` with custom module path to FastAPI app."""
-        monkeypatch.syspath_prepend(app_module_tmp_path)
-        monkeypatch.setenv("APP_MODULE", "tmp_app.main_fastapi:app")
-        start.set_app_module(logger=mock_logger)
-        mock_logger.debug.assert_called_once_with(  # type: ignore[attr-defined]
-            "App module set to tmp_app.main_fastapi:app."
-        )
-
-    def test_set_app_module_custom_starlette(
+    @pytest.mark.parametrize(
+        "app_module,use_tmp_path",
+        [
+            ("inboard.app.main_base:app", False),
+            ("inboard.app.main_fastapi:app", False),
+            ("inboard.app.main_starlette:app", False),
+            ("tmp_app.main_base:app", True),
+            ("tmp_app.main_fastapi:app", True),
+            ("tmp_app.main_starlette:app", True),
+        ],
+    )
+    def test_set_app_module(
         self,
+        app_module: str,
         app_module_tmp_path: Path,
         mock_logger: logging.Logger,
         monkeypatch: pytest.MonkeyPatch,
+        setenvs: _SetEnvs,
+        use_tmp_path: bool,
     ) -> None:
-        """Test `start.set_app_module` with custom module path to Starlette app."""
-        monkeypatch.syspath_prepend(app_module_tmp_path)
-        monkeypatch.setenv("APP_MODULE", "tmp_app.main_starlette:app")
+        """Test `start.set_app_module` with module paths to each app.
+        - Modules in the `inboard` package
+        - Custom modules copied to a temporary directory on `sys.path`
+        """
+        if use_tmp_path:
+            monkeypatch.syspath_prepend(app_module_tmp_path)
+        setenvs({"APP_MODULE": app_module})
         start.set_app_module(logger=mock_logger)
         mock_logger.debug.assert_called_once_with(  # type: ignore[attr-defined]
-            "App module set to tmp_app.main_starlette:app."
+            f"App module set to {app_module}."
         )
 
     def test_set_app_module_incorrect(
         self,
-        mocker: MockerFixture,
         mock_logger: logging.Logger,
-        monkeypatch: pytest.MonkeyPatch,
+        setenvs: _SetEnvs,
     ) -> None:
         """Test `start.set_app_module` with incorrect module path."""
-        with pytest.raises(ModuleNotFoundError):
-            incorrect_module = "inboard.app.incorrect.main:app"
-            monkeypatch.setenv("APP_MODULE", incorrect_module)
-            logger_error_msg = "Error when setting app module:"
-            incorrect_module_msg = f"No module named {incorrect_module}"
+        setenvs({"APP_MODULE": "inboard.app.incorrect.main:app"})
+        with pytest.raises(ModuleNotFoundError) as e:
             start.set_app_module(logger=mock_logger)
-            mock_logger.debug.assert_called_once_with(  # type: ignore[attr-defined]
-                f"{logger_error_msg} {incorrect_module_msg}."
-            )
+        assert str(e.value) == "No module named 'inboard.app.incorrect'"
+        mock_logger.debug.assert_called_once_with(  # type: ignore[attr-defined]
+            f"{_LOGGER_ERR_APP} {e.value}."
+        )
 
 
 class TestRunPreStartScript:
@@ -352,12 +295,12 @@ class TestRunPreStartScript:
         self,
         mock_logger: logging.Logger,
         mocker: MockerFixture,
-        monkeypatch: pytest.MonkeyPatch,
         pre_start_script_tmp_py: Path,
+        setenvs: _SetEnvs,
     ) -> None:
         """Test `start.run_pre_start_script` using temporary Python pre-start script."""
-        monkeypatch.setenv("PRE_START_PATH", str(pre_start_script_tmp_py))
-        pre_start_path = os.getenv("PRE_START_PATH")
+        pre_start_path = os.fspath(pre_start_script_tmp_py)
+        setenvs({"PRE_START_PATH": pre_start_path})
         start.run_pre_start_script(logger=mock_logger)
         mock_logger.debug.assert_has_calls(  # type: ignore[attr-defined]
             calls=[
@@ -371,12 +314,12 @@ class TestRunPreStartScript:
         self,
         mock_logger: logging.Logger,
         mocker: MockerFixture,
-        monkeypatch: pytest.MonkeyPatch,
         pre_start_script_tmp_sh: Path,
+        setenvs: _SetEnvs,
     ) -> None:
         """Test `start.run_pre_start_script` using temporary pre-start shell script."""
-        monkeypatch.setenv("PRE_START_PATH", str(pre_start_script_tmp_sh))
-        pre_start_path = os.getenv("PRE_START_PATH")
+        pre_start_path = os.fspath(pre_start_script_tmp_sh)
+        setenvs({"PRE_START_PATH": pre_start_path})
         start.run_pre_start_script(logger=mock_logger)
         mock_logger.debug.assert_has_calls(  # type: ignore[attr-defined]
             calls=[
@@ -390,10 +333,10 @@ class TestRunPreStartScript:
         self,
         mock_logger: logging.Logger,
         mocker: MockerFixture,
-        monkeypatch: pytest.MonkeyPatch,
+        setenvs: _SetEnvs,
     ) -> None:
         """Test `start.run_pre_start_script` with an incorrect file path."""
-        monkeypatch.setenv("PRE_START_PATH", "/no/file/here")
+        setenvs({"PRE_START_PATH": "/no/file/here"})
         start.run_pre_start_script(logger=mock_logger)
         mock_logger.debug.assert_has_calls(  # type: ignore[attr-defined]
             calls=[
@@ -416,37 +359,62 @@ class TestStartServer:
             "inboard.app.main_starlette:app",
         ],
     )
+    @pytest.mark.parametrize("process_manager", ["uvicorn", "gunicorn"])
     @pytest.mark.timeout(2)
-    def test_start_server_uvicorn(
+    def test_start_server(
         self,
         app_module: str,
         logging_conf_dict: Dict[str, Any],
         mock_logger: logging.Logger,
-        mocker: MockerFixture,
-        monkeypatch: pytest.MonkeyPatch,
+        process_manager: str,
+        request: pytest.FixtureRequest,
+        setenvs: _SetEnvs,
     ) -> None:
-        """Test `start.start_server` with Uvicorn."""
-        monkeypatch.setenv("PROCESS_MANAGER", "uvicorn")
-        assert os.getenv("PROCESS_MANAGER") == "uvicorn"
-        mock_run = mocker.patch("inboard.start.uvicorn.run", autospec=True)
-        start.start_server(
-            str(os.getenv("PROCESS_MANAGER")),
-            app_module=app_module,
-            logger=mock_logger,
-            logging_conf_dict=logging_conf_dict,
-        )
-        mock_logger.debug.assert_called_once_with(  # type: ignore[attr-defined]
-            "Running Uvicorn without Gunicorn."
-        )
-        mock_run.assert_called_once_with(
-            app_module,
-            host="0.0.0.0",
-            port=80,
-            log_config=logging_conf_dict,
-            log_level="info",
-            reload=False,
-            reload_dirs=None,
-        )
+        """Test `start.start_server` with Uvicorn, alone or managed by Gunicorn."""
+        setenvs(
+            {
+                "PROCESS_MANAGER": process_manager,
+                "RELOAD_DIRS": None,
+                "WITH_RELOAD": None,
+            }
+        )
+        if process_manager == "gunicorn":
+            gunicorn_conf_path = request.getfixturevalue("gunicorn_conf_path")
+            tmp_path = request.getfixturevalue("tmp_path")
+            conf_path = os.fspath(gunicorn_conf_path)
+            setenvs({"GUNICORN_CMD_ARGS": f"--worker-tmp-dir {tmp_path}"})
+            assert gunicorn_conf_path.parent.exists()
+            assert os.getenv("GUNICORN_CONF") == conf_path
+            run_target = "inboard.start.subprocess.run"
+        else:
+            run_target = "inboard.start.uvicorn.run"
+        with patch(run_target) as mock_run:
+            start.start_server(
+                str(os.getenv("PROCESS_MANAGER")),
+                app_module=app_module,
+                logger=mock_logger,
+                logging_conf_dict=logging_conf_dict,
+            )
+        if process_manager == "gunicorn":
+            mock_logger.debug.assert_called_once_with(  # type: ignore[attr-defined]
+                "Running Uvicorn with Gunicorn."
+            )
+            mock_run.assert_called_once_with(
+                _GUNICORN_ARGV_PREFIX + [conf_path, app_module]
+            )
+        else:
+            mock_logger.debug.assert_called_once_with(  # type: ignore[attr-defined]
+                "Running Uvicorn without Gunicorn."
+            )
+            mock_run.assert_called_once_with(
+                app_module,
+                host="0.0.0.0",
+                port=80,
+                log_config=logging_conf_dict,
+                log_level="info",
+                reload=False,
+                reload_dirs=None,
+            )
 
     @pytest.mark.parametrize(
         "app_module",
@@ -465,27 +433,29 @@ class TestStartServer:
         app_module: str,
         logging_conf_dict: Dict[str, Any],
         mock_logger: logging.Logger,
-        mocker: MockerFixture,
-        monkeypatch: pytest.MonkeyPatch,
         reload_dirs: str,
+        setenvs: _SetEnvs,
     ) -> None:
         """Test `start.start_server` with Uvicorn."""
-        monkeypatch.setenv("PROCESS_MANAGER", "uvicorn")
-        monkeypatch.setenv("RELOAD_DIRS", reload_dirs)
-        split_dirs = [d.lstrip() for d in str(os.getenv("RELOAD_DIRS")).split(sep=",")]
-        assert os.getenv("PROCESS_MANAGER") == "uvicorn"
-        assert os.getenv("RELOAD_DIRS") == reload_dirs
+        setenvs(
+            {
+                "PROCESS_MANAGER": "uvicorn",
+                "RELOAD_DIRS": reload_dirs,
+                "WITH_RELOAD": None,
+            }
+        )
+        split_dirs = [d.lstrip() for d in reload_dirs.split(sep=",")]
         if reload_dirs == "inboard":
             assert len(split_dirs) == 1
         else:
             assert len(split_dirs) == 2
-        mock_run = mocker.patch("inboard.start.uvicorn.run", autospec=True)
-        start.start_server(
-            str(os.getenv("PROCESS_MANAGER")),
-            app_module=app_module,
-            logger=mock_logger,
-            logging_conf_dict=logging_conf_dict,
-        )
+        with patch("inboard.start.uvicorn.run") as mock_run:
+            start.start_server(
+                str(os.getenv("PROCESS_MANAGER")),
+                app_module=app_module,
+                logger=mock_logger,
+                logging_conf_dict=logging_conf_dict,
+            )
         mock_logger.debug.assert_called_once_with(  # type: ignore[attr-defined]
             "Running Uvicorn without Gunicorn."
         )
@@ -499,55 +469,6 @@ class TestStartServer:
             reload_dirs=split_dirs,
         )
 
-    @pytest.mark.parametrize(
-        "app_module",
-        [
-            "inboard.app.main_base:app",
-            "inboard.app.main_fastapi:app",
-            "inboard.app.main_starlette:app",
-        ],
-    )
-    @pytest.mark.timeout(2)
-    def test_start_server_uvicorn_gunicorn(
-        self,
-        app_module: str,
-        gunicorn_conf_path: Path,
-        logging_conf_dict: Dict[str, Any],
-        mock_logger: logging.Logger,
-        mocker: MockerFixture,
-        monkeypatch: pytest.MonkeyPatch,
-        tmp_path: Path,
-    ) -> None:
-        """Test `start.start_server` with Uvicorn managed by Gunicorn."""
-        monkeypatch.setenv(
-            "GUNICORN_CMD_ARGS",
-            f"--worker-tmp-dir {tmp_path}",
-        )
-        monkeypatch.setenv("PROCESS_MANAGER", "gunicorn")
-        assert gunicorn_conf_path.parent.exists()
-        assert os.getenv("GUNICORN_CONF") == str(gunicorn_conf_path)
-        assert os.getenv("PROCESS_MANAGER") == "gunicorn"
-        mock_run = mocker.patch("inboard.start.subprocess.run", autospec=True)
-        start.start_server(
-            str(os.getenv("PROCESS_MANAGER")),
-            app_module=app_module,
-            logger=mock_logger,
-            logging_conf_dict=logging_conf_dict,
-        )
-        mock_logger.debug.assert_called_once_with(  # type: ignore[attr-defined]
-            "Running Uvicorn with Gunicorn."
-        )
-        mock_run.assert_called_once_with(
-            [
-                "gunicorn",
-                "-k",
-                "uvicorn.workers.UvicornWorker",
-                "-c",
-                str(gunicorn_conf_path),
-                app_module,
-            ]
-        )
-
     @pytest.mark.parametrize(
         "app_module",
         [
@@ -563,42 +484,33 @@ class TestStartServer:
         gunicorn_conf_tmp_file_path: Path,
         logging_conf_dict: Dict[str, Any],
         mock_logger: logging.Logger,
-        mocker: MockerFixture,
-        monkeypatch: pytest.MonkeyPatch,
+        setenvs: _SetEnvs,
     ) -> None:
         """Test customized `start.start_server` with Uvicorn managed by Gunicorn."""
-        monkeypatch.setenv(
-            "GUNICORN_CMD_ARGS",
-            f"--worker-tmp-dir {gunicorn_conf_tmp_file_path.parent}",
+        conf_path = os.fspath(gunicorn_conf_tmp_file_path)
+        setenvs(
+            {
+                "GUNICORN_CMD_ARGS": (
+                    f"--worker-tmp-dir {gunicorn_conf_tmp_file_path.parent}"
+                ),
+                "GUNICORN_CONF": conf_path,
+                "LOG_FORMAT": "gunicorn",
+                "LOG_LEVEL": "debug",
+                "PROCESS_MANAGER": "gunicorn",
+            }
         )
-        monkeypatch.setenv("LOG_FORMAT", "gunicorn")
-        monkeypatch.setenv("LOG_LEVEL", "debug")
-        monkeypatch.setenv("PROCESS_MANAGER", "gunicorn")
         assert gunicorn_conf_tmp_file_path.parent.exists()
-        assert os.getenv("GUNICORN_CONF") == str(gunicorn_conf_tmp_file_path)
-        assert os.getenv("LOG_FORMAT") == "gunicorn"
-        assert os.getenv("LOG_LEVEL") == "debug"
-        assert os.getenv("PROCESS_MANAGER") == "gunicorn"
-        mock_run = mocker.patch("inboard.start.subprocess.run", autospec=True)
-        start.start_server(
-            str(os.getenv("PROCESS_MANAGER")),
-            app_module=app_module,
-            logger=mock_logger,
-            logging_conf_dict=logging_conf_dict,
-        )
+        with patch("inboard.start.subprocess.run") as mock_run:
+            start.start_server(
+                str(os.getenv("PROCESS_MANAGER")),
+                app_module=app_module,
+                logger=mock_logger,
+                logging_conf_dict=logging_conf_dict,
+            )
         mock_logger.debug.assert_called_with(  # type: ignore[attr-defined]
             "Running Uvicorn with Gunicorn."
         )
-        mock_run.assert_called_with(
-            [
-                "gunicorn",
-                "-k",
-                "uvicorn.workers.UvicornWorker",
-                "-c",
-                str(gunicorn_conf_tmp_file_path),
-                app_module,
-            ]
-        )
+        mock_run.assert_called_with(_GUNICORN_ARGV_PREFIX + [conf_path, app_module])
 
     @pytest.mark.parametrize(
         "app_module",
@@ -615,13 +527,10 @@ class TestStartServer:
         gunicorn_conf_path: Path,
         logging_conf_dict: Dict[str, Any],
         mock_logger: logging.Logger,
-        mocker: MockerFixture,
-        monkeypatch: pytest.MonkeyPatch,
+        setenvs: _SetEnvs,
     ) -> None:
         """Test `start.start_server` with Uvicorn and an incorrect process manager."""
-        monkeypatch.setenv("LOG_LEVEL", "debug")
-        monkeypatch.setenv("WITH_RELOAD", "false")
-        logger_error_msg = "Error when starting server with start script:"
+        setenvs({"LOG_LEVEL": "debug", "WITH_RELOAD": "false"})
         process_error_msg = "Process manager needs to be either uvicorn or gunicorn."
         with pytest.raises(NameError) as e:
             start.start_server(
@@ -630,7 +539,7 @@ class TestStartServer:
                 logger=mock_logger,
                 logging_conf_dict=logging_conf_dict,
             )
-            assert e.value == process_error_msg
+        assert str(e.value) == process_error_msg
         mock_logger.error.assert_called_once_with(  # type: ignore[attr-defined]
-            f"{logger_error_msg} {process_error_msg}"
+            f"{_LOGGER_ERR_START} {process_error_msg}"
         )